@@ -1,4 +1,5 @@
 import logging
+from sys import intern
 from asyncio import get_event_loop
 
 
@@ -14,36 +15,41 @@ cdef class EventHandler:
     ONE_TIME_EVENTS = None
 
     cpdef dict events(self):
-        if self._events is None:
-            self._events = {}
+        cdef dict events = self._events
+        if events is None:
+            events = {}
             for n in self.ONE_TIME_EVENTS or ():
-                self._events[n] = Event(n, self, 1)
-        return self._events
+                events[n] = Event(n, self, 1)
+            self._events = events
+        return events
 
     cpdef Event event(self, str name):
         """Returns the :event at ``name``.
         """
         cdef dict events = self.events()
+        cdef object event
         if name is None:
             raise ValueError('event name must be a string')
-        if name not in events:
+        event = events.get(name)
+        if event is None:
+            name = intern(name)
             event = Event(name, self, 0)
             events[name] = event
-        return events[name]
+        return <Event>event
 
     cpdef fire_event(self, str name, exc=None, data=None):
-        cdef dict events = self.events()
-        if name in events:
-            events[name].fire(exc=exc, data=data)
+        cdef object event = self.events().get(name)
+        if event is not None:
+            (<Event>event).fire(exc, data)
 
     cpdef bind_events(self, dict events):
         '''Register all known events found in ``events`` key-valued parameters.
         '''
         cdef dict evs = self.events()
+        cdef object name
         if evs and events:
-            for event in evs.values():
-                if event.name in events:
-                    event.bind(events[event.name])
+            for name in evs.keys() & events.keys():
+                (<Event>evs[name]).bind(events[name])
 
     cpdef copy_many_times_events(self, EventHandler other):
         '''Copy :ref:`many times events <many-times-event>` from  ``other``.
@@ -51,22 +57,24 @@ cdef class EventHandler:
         All many times events of ``other`` are copied to this handler
         provided the events handlers already exist.
         '''
-        cdef dict events = self.events()
-        cdef dict other_events = other.events() if other else None
+        cdef dict events
+        cdef dict other_events = other._events if other else None
         cdef str name
         cdef Event event
         cdef list handlers
+        cdef object ev
         cdef object callback
 
-        if events and other_events:
+        if other_events:
+            events = self.events()
             for name, event in other_events.items():
-                handlers = event.handlers()
-                if not event.onetime() and handlers:
+                handlers = event._handlers
+                if handlers and not event._onetime:
                     ev = events.get(name)
                     # If the event is available add it
-                    if ev:
+                    if ev is not None:
                         for callback in handlers:
-                            ev.bind(callback)
+                            (<Event>ev).bind(callback)
 
 
 cdef class Event:
@@ -120,6 +128,7 @@ cdef class Event:
 
     cpdef fire(self, exc=None, data=None):
         cdef object o = self._self
+        cdef object waiter
         cdef list handlers
 
         if o is not None:
@@ -139,16 +148,19 @@ cdef class Event:
                     for hnd in handlers:
                         hnd(o)
 
-            if self._waiter:
+            waiter = self._waiter
+            if waiter is not None:
+                self._waiter = None
                 if exc:
-                    self._waiter.set_exception(exc)
+                    waiter.set_exception(exc)
                 else:
-                    self._waiter.set_result(data if data is not None else o)
-                self._waiter = None
+                    waiter.set_result(data if data is not None else o)
 
     cpdef object waiter(self):
-        if not self._waiter:
-            self._waiter = get_event_loop().create_future()
-            if self.fired():
-                self._waiter.set_result(None)
-        return self._waiter
+        cdef object waiter = self._waiter
+        if waiter is None:
+            waiter = get_event_loop().create_future()
+            if self._self is None:
+                waiter.set_result(None)
+            self._waiter = waiter
+        return waiter
@@ -104,7 +104,7 @@ class DatagramProtocol(PulsarProtocol, asyncio.DatagramProtocol):
             if not consumer.request:
                 consumer.start()
             toprocess = consumer.feed_data(data)
-            consumer.fire_event('data_processed', data=data, exc=None)
+            consumer.fire_event('data_processed', None, data)
             data = toprocess
         self.changed()
 
@@ -1,4 +1,5 @@
 import logging
+from sys import intern
 from asyncio import get_event_loop
 
 
@@ -90,12 +91,13 @@ class Event:
                     for hnd in handlers:
                         hnd(o)
 
-            if self._waiter:
+            waiter = self._waiter
+            if waiter is not None:
+                self._waiter = None
                 if exc:
-                    self._waiter.set_exception(exc)
+                    waiter.set_exception(exc)
                 else:
-                    self._waiter.set_result(data if data is not None else o)
-                self._waiter = None
+                    waiter.set_result(data if data is not None else o)
 
     def waiter(self):
         """Return a :class:`~asyncio.Future` called back once the event
@@ -105,11 +107,13 @@ class Event:
         This method is available only for one-time events
         """
         assert self._onetime, 'One time events only can invoke waiter'
-        if not self._waiter:
-            self._waiter = get_event_loop().create_future()
-            if self.fired():
-                self._waiter.set_result(None)
-        return self._waiter
+        waiter = self._waiter
+        if waiter is None:
+            waiter = get_event_loop().create_future()
+            if self._self is None:
+                waiter.set_result(None)
+            self._waiter = waiter
+        return waiter
 
 
 class EventHandler:
@@ -124,7 +128,7 @@ class EventHandler:
     def events(self):
         if self._events is None:
             ot = self.ONE_TIME_EVENTS or ()
-            self._events = dict(((n, Event(n, self, 1)) for n in ot))
+            self._events = {n: Event(n, self, 1) for n in ot}
         return self._events
 
     def event(self, name):
@@ -135,14 +139,17 @@ class EventHandler:
         """
         events = self.events()
         if name not in events:
+            if type(name) is str:
+                name = intern(name)
             events[name] = Event(name, self, 0)
         return events[name]
 
     def fire_event(self, name, exc=None, data=None):
         """Fire event at ``name`` if it is registered
         """
-        if self._events and name in self._events:
-            self._events[name].fire(exc=exc, data=data)
+        events = self._events
+        if events and name in events:
+            events[name].fire(exc, data)
 
     def bind_events(self, events):
         '''Register all known events found in ``events`` key-valued parameters.
@@ -159,14 +166,14 @@ class EventHandler:
         All many times events of ``other`` are copied to this handler
         provided the events handlers already exist.
         '''
-        events = self.events()
-        other_events = other.events()
-        if events and other_events:
+        other_events = other._events
+        if other_events:
+            events = self.events()
             for name, event in other_events.items():
-                handlers = event.handlers()
-                if not event.onetime() and handlers:
+                handlers = event._handlers
+                if handlers and not event._onetime:
                     ev = events.get(name)
                     # If the event is available add it
-                    if ev:
+                    if ev is not None:
                         for callback in handlers:
                             ev.bind(callback)
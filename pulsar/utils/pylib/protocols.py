@@ -179,7 +179,7 @@ class Protocol(EventHandler):
                 if not consumer.request:
                     consumer.start()
                 toprocess = consumer.feed_data(data)
-                consumer.fire_event('data_processed', data=data, exc=None)
+                consumer.fire_event('data_processed', None, data)
                 data = toprocess
             self.changed()
         except Exception:
@@ -1,6 +1,8 @@
 import unittest
+from sys import intern
 
 from pulsar.api import EventHandler
+from pulsar.utils.pylib.events import EventHandler as PyEventHandler
 
 
 class Handler(EventHandler):
@@ -62,3 +64,51 @@ class TestFailure(unittest.TestCase):
         self.assertEqual(h2.event('start').onetime(), True)
         h2.copy_many_times_events(h)
         self.assertEqual(h2.event('start').handlers(), [cbk])
+
+    async def test_waiter(self):
+        h = Handler()
+        waiter = h.event('start').waiter()
+        self.assertFalse(waiter.done())
+        self.assertEqual(h.event('start').waiter(), waiter)
+        h.event('start').fire(data=3)
+        self.assertEqual(await waiter, 3)
+        waiter = h.event('start').waiter()
+        self.assertTrue(waiter.done())
+        self.assertEqual(waiter.result(), None)
+
+    def test_copy_many_times_events_skip_one_time(self):
+        h = Handler()
+        h2 = Handler()
+
+        def cbk(_, **kw):
+            return kw
+
+        h.event('start').bind(cbk)
+        h.event('many').bind(cbk)
+        h2.copy_many_times_events(h)
+        self.assertEqual(h2.event('start').handlers(), None)
+        self.assertEqual(h2.event('many').handlers(), None)
+        h2.copy_many_times_events(EventHandler())
+        self.assertEqual(h2.event('start').handlers(), None)
+
+    def test_event_name_interned(self):
+        h = Handler()
+        name = ''.join(('dyna', 'mic'))
+        self.assertIs(h.event(name).name, intern(name))
+        self.assertIs(h.event(name), h.event('dynamic'))
+
+        class Name(str):
+            pass
+
+        # only exact strings are interned
+        h = PyEventHandler()
+        e = h.event(Name('foo'))
+        self.assertEqual(e.name, 'foo')
+        self.assertIs(h.event('foo'), e)
+        self.assertEqual(h.event(None).name, None)
+
+    def test_event_slots(self):
+        for e in (Handler().event('start'), PyEventHandler().event('x')):
+            self.assertFalse(hasattr(e, '__dict__'))
+            with self.assertRaises(AttributeError):
+                e.foo = 1